@@ -3,12 +3,26 @@
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN,
+    ATTR_BANDS,
+    ATTR_DRY_RUN,
+    ATTR_RSSI_THRESHOLD,
+    BAND_MAP,
+    DATA_FLOW_HANDOFF,
     CONF_CONTROLLER_URL,
     CONF_USERNAME,
     CONF_PASSWORD,
@@ -16,40 +30,70 @@ from .const import (
     CONF_VERIFY_SSL,
     DEFAULT_SITE,
     DEFAULT_VERIFY_SSL,
+    DEFAULT_RSSI_THRESHOLD,
+    SERVICE_PLAN_TX_POWER,
 )
 from .coordinator import UniFiAPCoordinator
+from .journal import UniFiWriteJournal
 from .unifi_api import UniFiController
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SELECT, Platform.SWITCH]
+PLATFORMS: list[Platform] = [Platform.SELECT, Platform.SENSOR, Platform.SWITCH]
+
+PLAN_TX_POWER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DRY_RUN, default=True): cv.boolean,
+        vol.Optional(ATTR_RSSI_THRESHOLD, default=DEFAULT_RSSI_THRESHOLD): vol.All(
+            vol.Coerce(int), vol.Range(min=-100, max=-30)
+        ),
+        vol.Optional(ATTR_BANDS): vol.All(cv.ensure_list, [vol.In(list(BAND_MAP))]),
+    }
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HA UniFi AP Control from a config entry."""
     _LOGGER.info("Setting up HA UniFi AP Control integration")
 
-    # Create API client
-    api = UniFiController(
-        controller_url=entry.data[CONF_CONTROLLER_URL],
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        site=entry.data.get(CONF_SITE, DEFAULT_SITE),
-        verify_ssl=entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-    )
+    site = entry.data.get(CONF_SITE, DEFAULT_SITE)
+
+    # Reuse the session and snapshot from a config flow that just finished
+    handoff = hass.data.get(DATA_FLOW_HANDOFF, {}).pop(entry.unique_id, None)
+
+    if handoff is not None and handoff["api"].site == site:
+        api = handoff["api"]
+    else:
+        handoff = None
+
+        # Create API client
+        api = UniFiController(
+            controller_url=entry.data[CONF_CONTROLLER_URL],
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+            site=site,
+            verify_ssl=entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+        )
+
+        # Login to controller
+        try:
+            await hass.async_add_executor_job(api.login)
+        except Exception as err:
+            _LOGGER.error("Failed to login to UniFi controller: %s", err)
+            return False
 
-    # Login to controller
-    try:
-        await hass.async_add_executor_job(api.login)
-    except Exception as err:
-        _LOGGER.error("Failed to login to UniFi controller: %s", err)
-        return False
+    # Load writes still queued from a previous run
+    journal = UniFiWriteJournal(hass, entry.entry_id)
+    await journal.async_load()
 
     # Create coordinator
-    coordinator = UniFiAPCoordinator(hass, api)
+    coordinator = UniFiAPCoordinator(hass, api, journal)
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data, unless the config flow already did
+    if handoff is not None:
+        coordinator.async_set_updated_data({ap["mac"]: ap for ap in handoff["aps"]})
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     _LOGGER.info(
         "Found %d access points on UniFi controller",
@@ -63,12 +107,87 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Register services once for all config entries
+    if not hass.services.has_service(DOMAIN, SERVICE_PLAN_TX_POWER):
+        _async_register_services(hass)
+
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version == 1:
+        # Unique IDs include the site so several sites of one controller fit
+        site = entry.data.get(CONF_SITE, DEFAULT_SITE)
+        unique_id = f"{entry.data[CONF_CONTROLLER_URL]}_{site}"
+        try:
+            hass.config_entries.async_update_entry(
+                entry, unique_id=unique_id, version=2
+            )
+        except TypeError:
+            # Releases before 2024.3 have no version argument on update
+            entry.version = 2
+            hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+        _LOGGER.info("Migrated config entry to version %s", entry.version)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: UniFiAPCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_cancel_replay()
+        coordinator.async_cancel_writers()
+
+        # Remove services when the last controller is unloaded
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_PLAN_TX_POWER)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the write journal when a config entry is deleted."""
+    await UniFiWriteJournal(hass, entry.entry_id).async_remove()
+
+
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def async_plan_tx_power(call: ServiceCall) -> ServiceResponse:
+        """Plan (and optionally apply) tx power for every controller."""
+        results: dict[str, Any] = {}
+
+        coordinator: UniFiAPCoordinator
+        for entry_id, coordinator in hass.data[DOMAIN].items():
+            # One unreachable controller must not stop planning for the others
+            try:
+                result = await coordinator.async_plan_tx_power(
+                    rssi_threshold=call.data[ATTR_RSSI_THRESHOLD],
+                    bands=call.data.get(ATTR_BANDS),
+                    dry_run=call.data[ATTR_DRY_RUN],
+                )
+            except HomeAssistantError as err:
+                _LOGGER.error("Power plan for %s failed: %s", entry_id, err)
+                results[entry_id] = {"error": str(err)}
+                continue
+
+            _LOGGER.info(
+                "Power plan for %s: %d of %d radios to change%s",
+                entry_id,
+                len(result["changes"]),
+                result["radios_planned"],
+                " (dry run)" if result["dry_run"] else "",
+            )
+            results[entry_id] = result
+
+        return {"controllers": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PLAN_TX_POWER,
+        async_plan_tx_power,
+        schema=PLAN_TX_POWER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -12,6 +12,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     DOMAIN,
+    DATA_FLOW_HANDOFF,
     CONF_CONTROLLER_URL,
     CONF_USERNAME,
     CONF_PASSWORD,
@@ -20,7 +21,7 @@ from .const import (
     DEFAULT_SITE,
     DEFAULT_VERIFY_SSL,
 )
-from .unifi_api import UniFiController, UniFiAPIError
+from .unifi_api import UniFiController, UniFiAPIError, UniFiAuthError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,14 +30,18 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_CONTROLLER_URL, default="https://192.168.1.1:8443"): str,
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
-        vol.Optional(CONF_SITE, default=DEFAULT_SITE): str,
         vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
     }
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+async def validate_input(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> tuple[UniFiController, list[dict[str, Any]]]:
+    """Log in once and list the sites the account can access.
+
+    The site list is empty if the controller does not provide one.
+    """
     api = UniFiController(
         controller_url=data[CONF_CONTROLLER_URL],
         username=data[CONF_USERNAME],
@@ -46,24 +51,37 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     )
 
     try:
-        # Test connection in executor to avoid blocking
-        result = await hass.async_add_executor_job(api.test_connection)
-        if not result:
-            raise CannotConnect("Failed to connect to UniFi controller")
-
-        # Get AP count for title
-        aps = await hass.async_add_executor_job(api.get_access_points)
-        return {"title": f"UniFi Controller ({len(aps)} APs)"}
+        # Run in executor to avoid blocking
+        await hass.async_add_executor_job(api.login)
 
+    except UniFiAuthError as err:
+        raise InvalidAuth(str(err)) from err
     except UniFiAPIError as err:
         _LOGGER.error("Failed to connect to UniFi controller: %s", err)
         raise CannotConnect(str(err)) from err
 
+    try:
+        sites = await hass.async_add_executor_job(api.get_sites)
+    except UniFiAPIError as err:
+        # Restricted accounts and some controllers cannot list sites, the
+        # site name is then entered by hand
+        _LOGGER.warning("Could not list sites, asking for the site name: %s", err)
+        sites = []
+
+    return api, sites
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HA UniFi AP Control."""
 
-    VERSION = 1
+    VERSION = 2
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._user_input: dict[str, Any] = {}
+        self._api: UniFiController | None = None
+        # None when the controller cannot list sites
+        self._sites: dict[str, dict[str, Any]] | None = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -73,7 +91,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
+                api, sites = await validate_input(self.hass, user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -82,11 +100,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Check if already configured
-                await self.async_set_unique_id(user_input[CONF_CONTROLLER_URL])
-                self._abort_if_unique_id_configured()
-
-                return self.async_create_entry(title=info["title"], data=user_input)
+                self._user_input = user_input
+                self._api = api
+
+                if not sites:
+                    self._sites = None
+                    return await self.async_step_site()
+
+                # Only offer sites of this controller that are not set up yet
+                configured = {
+                    entry.unique_id for entry in self._async_current_entries()
+                }
+                self._sites = {
+                    site["name"]: site
+                    for site in sites
+                    if f"{user_input[CONF_CONTROLLER_URL]}_{site['name']}"
+                    not in configured
+                }
+
+                if not self._sites:
+                    return self.async_abort(reason="already_configured")
+
+                if len(self._sites) == 1:
+                    return await self.async_step_site(
+                        {CONF_SITE: next(iter(self._sites))}
+                    )
+
+                return await self.async_step_site()
 
         return self.async_show_form(
             step_id="user",
@@ -94,6 +134,65 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_site(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick one of the account's sites, or enter its name."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            site = user_input[CONF_SITE]
+            await self.async_set_unique_id(
+                f"{self._user_input[CONF_CONTROLLER_URL]}_{site}"
+            )
+            self._abort_if_unique_id_configured()
+
+            assert self._api is not None
+            self._api.site = site
+
+            try:
+                aps = await self.hass.async_add_executor_job(
+                    self._api.get_access_points
+                )
+            except UniFiAPIError as err:
+                _LOGGER.error("Failed to fetch access points: %s", err)
+                errors["base"] = "cannot_connect"
+            else:
+                # Hand the logged-in client and first snapshot to async_setup_entry
+                self.hass.data.setdefault(DATA_FLOW_HANDOFF, {})[self.unique_id] = {
+                    "api": self._api,
+                    "aps": aps,
+                }
+
+                return self.async_create_entry(
+                    title=f"UniFi Controller ({len(aps)} APs)",
+                    data={**self._user_input, CONF_SITE: site},
+                )
+
+        if self._sites is None:
+            # No site list, fall back to a free text site name
+            default = user_input[CONF_SITE] if user_input else DEFAULT_SITE
+            field: Any = str
+        else:
+            field = vol.In(
+                {
+                    name: f"{site['description']} ({site['num_ap']} APs)"
+                    for name, site in self._sites.items()
+                }
+            )
+            if user_input is not None:
+                default = user_input[CONF_SITE]
+            elif DEFAULT_SITE in self._sites:
+                default = DEFAULT_SITE
+            else:
+                default = next(iter(self._sites))
+
+        return self.async_show_form(
+            step_id="site",
+            data_schema=vol.Schema({vol.Required(CONF_SITE, default=default): field}),
+            errors=errors,
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
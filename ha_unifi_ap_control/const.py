@@ -2,6 +2,9 @@
 
 DOMAIN = "ha_unifi_ap_control"
 
+# Logged-in client and first AP snapshot passed from the config flow to setup
+DATA_FLOW_HANDOFF = f"{DOMAIN}_flow_handoff"
+
 CONF_CONTROLLER_URL = "controller_url"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
@@ -28,3 +31,20 @@ SCAN_INTERVAL = 60
 LED_MODE_DEFAULT = "default"  # Use site setting
 LED_MODE_ON = "on"
 LED_MODE_OFF = "off"
+
+# Transmit power planner service
+SERVICE_PLAN_TX_POWER = "plan_tx_power"
+ATTR_DRY_RUN = "dry_run"
+ATTR_RSSI_THRESHOLD = "rssi_threshold"
+ATTR_BANDS = "bands"
+DEFAULT_RSSI_THRESHOLD = -75
+
+# Write journal for changes made while the controller is unreachable
+JOURNAL_STORAGE_VERSION = 1
+JOURNAL_SAVE_DELAY = 1  # seconds
+JOURNAL_REPLAY_DELAY = 0.5  # seconds between device updates during replay
+
+# Write counters kept by the coordinator
+STAT_WRITES_SENT = "writes_sent"
+STAT_WRITES_SKIPPED = "writes_skipped_noop"
+STAT_WRITES_DEDUPLICATED = "writes_deduplicated"
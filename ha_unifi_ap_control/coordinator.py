@@ -1,22 +1,41 @@
 """Data coordinator for UniFi AP Power Control."""
 
+import asyncio
 import logging
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    JOURNAL_REPLAY_DELAY,
+    SCAN_INTERVAL,
+    STAT_WRITES_DEDUPLICATED,
+    STAT_WRITES_SENT,
+    STAT_WRITES_SKIPPED,
+)
+from .journal import FIELD_LED, FIELD_POWER, UniFiWriteJournal
+from .planner import plan_tx_power
 from .unifi_api import UniFiController, UniFiAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
+# A device field: (FIELD_POWER, band) or (FIELD_LED, None)
+FieldKey = tuple[str, str | None]
+
+# Changes for one AP and the future resolved once they were sent
+PendingUpdate = tuple[dict[FieldKey, str], asyncio.Future[bool]]
+
 
 class UniFiAPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage fetching UniFi AP data."""
 
-    def __init__(self, hass: HomeAssistant, api: UniFiController) -> None:
+    def __init__(
+        self, hass: HomeAssistant, api: UniFiController, journal: UniFiWriteJournal
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -25,48 +44,241 @@ class UniFiAPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=SCAN_INTERVAL),
         )
         self.api = api
+        self.journal = journal
+        self._replay_task: asyncio.Task | None = None
+        # Per-AP write state: changes waiting for the next update, changes
+        # currently being sent, the task sending them and a lock shared with
+        # journal replay so updates to one AP never overlap
+        self._rounds: dict[str, PendingUpdate] = {}
+        self._inflight: dict[str, PendingUpdate] = {}
+        self._writers: dict[str, asyncio.Task] = {}
+        self._device_locks: dict[str, asyncio.Lock] = {}
+        self.write_stats: dict[str, int] = {
+            STAT_WRITES_SENT: 0,
+            STAT_WRITES_SKIPPED: 0,
+            STAT_WRITES_DEDUPLICATED: 0,
+        }
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the UniFi controller."""
         try:
             aps = await self.hass.async_add_executor_job(self.api.get_access_points)
 
-            # Index by MAC address for easy lookup
-            return {ap["mac"]: ap for ap in aps}
-
         except UniFiAPIError as err:
             raise UpdateFailed(f"Error communicating with UniFi controller: {err}") from err
 
-    async def async_set_power(
-        self, mac: str, band: str, power: str
+        # Index by MAC address for easy lookup
+        data = {ap["mac"]: ap for ap in aps}
+
+        # Controller is reachable again, flush anything queued while it was not
+        if len(self.journal) and self._replay_task is None:
+            self._replay_task = self.hass.async_create_task(
+                self._async_replay_journal(data)
+            )
+
+        return data
+
+    def pending_power(self, mac: str, band: str) -> str | None:
+        """Return the queued power level for an AP band, if any."""
+        return self.journal.get(mac, FIELD_POWER, band)
+
+    def pending_led(self, mac: str) -> str | None:
+        """Return the queued LED mode for an AP, if any."""
+        return self.journal.get(mac, FIELD_LED)
+
+    def _queue_write(
+        self, mac: str, field: str, value: str, band: str | None = None
+    ) -> None:
+        """Queue a write for replay and show it on the entities."""
+        self.journal.queue(mac, field, value, band)
+        self.async_update_listeners()
+
+    def _expected_value(
+        self, mac: str, key: FieldKey
+    ) -> tuple[str | None, asyncio.Future[bool] | None]:
+        """Return the value a device field is heading to.
+
+        The second item is the result of the update carrying that value when
+        it is waiting to be sent or in flight, or None when the value comes
+        from the journal or the cached controller state.
+        """
+        for updates in (self._rounds, self._inflight):
+            if (update := updates.get(mac)) is not None and key in update[0]:
+                return update[0][key], update[1]
+
+        field, band = key
+        if (pending := self.journal.get(mac, field, band)) is not None:
+            return pending, None
+
+        return self._cached_value(mac, key), None
+
+    def _cached_value(self, mac: str, key: FieldKey) -> str | None:
+        """Return the last known controller value of a device field."""
+        field, band = key
+        ap = self.data[mac]
+        if field == FIELD_POWER:
+            return ap["radios"].get(band, {}).get("power")
+        return ap.get("led_override", "default")
+
+    async def _async_submit(
+        self, mac: str, changes: dict[FieldKey, str]
     ) -> bool:
-        """Set power level for a specific AP and band."""
+        """Request new values for device fields.
+
+        Values that are already current, queued or on their way are dropped.
+        The rest join the next update for the AP, so concurrent changes to
+        one AP are merged into as few PUTs as possible and always sent in
+        order, with the latest value per field winning.
+        """
+        needed: dict[FieldKey, str] = {}
+        results: set[asyncio.Future[bool]] = set()
+
+        for key, value in changes.items():
+            expected, update = self._expected_value(mac, key)
+
+            if value == expected:
+                if update is not None:
+                    # Identical change already on its way, share its result
+                    self.write_stats[STAT_WRITES_DEDUPLICATED] += 1
+                    results.add(update)
+                else:
+                    self.write_stats[STAT_WRITES_SKIPPED] += 1
+                _LOGGER.debug("Skipping %s write for %s, already %s", key, mac, value)
+            elif update is None and value == self._cached_value(mac, key):
+                # The controller already has this value, drop the stale queued one
+                self.journal.remove(mac, *key)
+                self.async_update_listeners()
+                self.write_stats[STAT_WRITES_SKIPPED] += 1
+            else:
+                needed[key] = value
+
+        if needed:
+            waiting = self._rounds.get(mac)
+            if waiting is None:
+                waiting = self._rounds[mac] = ({}, self.hass.loop.create_future())
+            else:
+                # Values replaced before they were sent are writes saved as well
+                self.write_stats[STAT_WRITES_DEDUPLICATED] += len(
+                    needed.keys() & waiting[0].keys()
+                )
+            waiting[0].update(needed)
+            results.add(waiting[1])
+
+            if mac not in self._writers:
+                self._writers[mac] = self.hass.async_create_task(
+                    self._async_run_writer(mac)
+                )
+
+        return all(
+            await asyncio.gather(*(asyncio.shield(result) for result in results))
+        )
+
+    async def _async_run_writer(self, mac: str) -> None:
+        """Send the waiting updates for an AP until none are left."""
+        try:
+            while (waiting := self._rounds.pop(mac, None)) is not None:
+                desired, future = waiting
+                self._inflight[mac] = waiting
+                try:
+                    result = await self._async_send_device(mac, desired)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Unexpected error updating %s", mac)
+                    result = False
+                self._inflight.pop(mac, None)
+                future.set_result(result)
+
+        except asyncio.CancelledError:
+            # Unload or shutdown, callers must not wait on a result forever
+            self._async_release_writes(mac)
+            raise
+
+        finally:
+            self._writers.pop(mac, None)
+
+        # Refresh data to get new state
+        await self.async_request_refresh()
+
+    async def _async_send_device(
+        self, mac: str, desired: dict[FieldKey, str]
+    ) -> bool:
+        """Send merged changes to one AP, or queue them if unreachable."""
+        powers = {
+            band: value
+            for (field, band), value in desired.items()
+            if field == FIELD_POWER
+        }
+        led = desired.get((FIELD_LED, None))
+
+        if not self.last_update_success:
+            _LOGGER.warning("Controller unreachable, queueing changes for %s", mac)
+            for (field, band), value in desired.items():
+                self._queue_write(mac, field, value, band)
+            return True
+
         if mac not in self.data:
             _LOGGER.error("AP with MAC %s not found", mac)
             return False
 
-        ap = self.data[mac]
+        success = True
 
-        try:
-            success = await self.hass.async_add_executor_job(
-                self.api.set_radio_power,
-                ap["id"],
-                mac,
-                ap["raw_radio_table"],
-                band,
-                power,
-            )
+        async with self._device_lock(mac):
+            ap = self.data[mac]
 
-            if success:
-                # Refresh data to get new state
-                await self.async_request_refresh()
+            try:
+                # All bands for the AP go out in a single radio table update
+                if powers:
+                    self.write_stats[STAT_WRITES_SENT] += 1
+                    if await self.hass.async_add_executor_job(
+                        self.api.set_radio_powers,
+                        ap["id"],
+                        mac,
+                        ap["raw_radio_table"],
+                        powers,
+                    ):
+                        # A direct write supersedes anything still queued
+                        for band in powers:
+                            self.journal.remove(mac, FIELD_POWER, band)
 
-            return success
+                        # Record the new levels so repeats are no-ops and
+                        # later writes start from the updated radio table
+                        self._apply_power(mac, powers)
+                    else:
+                        success = False
+                    powers = {}
 
-        except UniFiAPIError as err:
-            _LOGGER.error("Failed to set power: %s", err)
+                if led is not None:
+                    self.write_stats[STAT_WRITES_SENT] += 1
+                    if await self.hass.async_add_executor_job(
+                        self.api.set_led_override, ap["id"], mac, led
+                    ):
+                        self.journal.remove(mac, FIELD_LED)
+                        self._apply_led(mac, led)
+                    else:
+                        success = False
+
+            except UniFiAPIError as err:
+                _LOGGER.warning("Failed to update %s, queueing for retry: %s", mac, err)
+                for band, power in powers.items():
+                    self._queue_write(mac, FIELD_POWER, power, band)
+                if led is not None:
+                    self._queue_write(mac, FIELD_LED, led)
+
+        return success
+
+    def _device_lock(self, mac: str) -> asyncio.Lock:
+        """Return the lock serializing controller updates for one AP."""
+        return self._device_locks.setdefault(mac, asyncio.Lock())
+
+    async def async_set_power(
+        self, mac: str, band: str, power: str
+    ) -> bool:
+        """Set power level for a specific AP and band."""
+        if mac not in self.data:
+            _LOGGER.error("AP with MAC %s not found", mac)
             return False
 
+        return await self._async_submit(mac, {(FIELD_POWER, band): power})
+
     async def async_set_led(self, mac: str, mode: str) -> bool:
         """Set LED mode for a specific AP.
 
@@ -78,22 +290,224 @@ class UniFiAPCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("AP with MAC %s not found", mac)
             return False
 
-        ap = self.data[mac]
+        return await self._async_submit(mac, {(FIELD_LED, None): mode})
+
+    def _apply_led(self, mac: str, led: str) -> None:
+        """Update cached AP data after a successful LED change."""
+        # Looked up after the write, a refresh may have replaced the data
+        if (ap := self.data.get(mac)) is not None:
+            ap["led_override"] = led
+
+    def _apply_power(self, mac: str, powers: dict[str, str]) -> None:
+        """Update cached AP data after a successful power change."""
+        # Looked up after the write, a refresh may have replaced the data
+        if (ap := self.data.get(mac)) is None:
+            return
+
+        by_radio_name = {}
+        for band, power in powers.items():
+            if band in ap["radios"]:
+                ap["radios"][band]["power"] = power
+                by_radio_name[ap["radios"][band]["radio_name"]] = power
+
+        # Later writes start from this table, so keep it in step as well
+        ap["raw_radio_table"] = [
+            {**radio, "tx_power_mode": by_radio_name[radio.get("name")]}
+            if radio.get("name") in by_radio_name
+            else radio
+            for radio in ap["raw_radio_table"]
+        ]
+
+    def _async_release_writes(self, mac: str) -> None:
+        """Queue an AP's unsent changes and release the callers waiting on them.
+
+        The in-flight update may or may not have reached the controller;
+        replay skips it if it did.
+        """
+        for updates in (self._inflight, self._rounds):
+            if (update := updates.pop(mac, None)) is None:
+                continue
+
+            desired, future = update
+            for (field, band), value in desired.items():
+                self.journal.queue(mac, field, value, band)
+            if not future.done():
+                future.set_result(False)
+
+    def async_cancel_writers(self) -> None:
+        """Stop the per-AP writers, leaving their unsent changes queued."""
+        while self._writers:
+            mac, task = self._writers.popitem()
+            task.cancel()
+            # A writer cancelled before it first ran never sees the error
+            self._async_release_writes(mac)
 
+    def async_cancel_replay(self) -> None:
+        """Stop an in-progress journal replay, leaving the rest queued."""
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+
+    async def _async_replay_journal(self, data: dict[str, Any]) -> None:
+        """Replay queued writes, one device update at a time."""
         try:
-            success = await self.hass.async_add_executor_job(
-                self.api.set_led_override,
-                ap["id"],
-                mac,
-                mode,
-            )
+            pending = self.journal.pending_by_device()
+            _LOGGER.info("Replaying queued writes for %d APs", len(pending))
+
+            for index, (mac, entries) in enumerate(pending.items()):
+                if index:
+                    # Rate limit so a long outage does not flood the controller
+                    await asyncio.sleep(JOURNAL_REPLAY_DELAY)
 
-            if success:
-                # Refresh data to get new state
-                await self.async_request_refresh()
+                if not await self._async_replay_device(data.get(mac), mac, entries):
+                    _LOGGER.warning("Controller unreachable, pausing journal replay")
+                    break
 
-            return success
+            # Refresh once after the whole replay rather than per AP
+            await self.async_request_refresh()
+
+        finally:
+            self._replay_task = None
+
+    async def _async_replay_device(
+        self, ap: dict[str, Any] | None, mac: str, entries: list[dict[str, Any]]
+    ) -> bool:
+        """Replay the queued writes for one AP.
+
+        Returns False if the controller could not be reached.
+        """
+        if ap is None:
+            _LOGGER.warning("Dropping queued writes for unknown AP %s", mac)
+            for entry in entries:
+                self.journal.discard(mac, entry["field"], entry["value"], entry["band"])
+            return True
+
+        # Unavailable (5xx) and connection errors raise and keep the entries
+        # queued; other rejections would fail again on retry, so are dropped
+        try:
+            async with self._device_lock(mac):
+                # Send from the live cache so earlier writes are not undone
+                ap = (self.data or {}).get(mac, ap)
+
+                # Commands issued since the replay started replace or clear
+                # queued values, so read the journal again rather than
+                # trusting the copied entries
+                powers: dict[str, str] = {}
+                led = None
+
+                for entry in entries:
+                    field, band = entry["field"], entry["band"]
+                    if (value := self.journal.get(mac, field, band)) is None:
+                        continue
+
+                    if field == FIELD_POWER:
+                        current = ap["radios"].get(band, {}).get("power")
+                    else:
+                        current = ap.get("led_override", "default")
+
+                    # Skip values the controller already has, e.g. set from
+                    # its own UI
+                    if value == current:
+                        self.write_stats[STAT_WRITES_SKIPPED] += 1
+                        self.journal.discard(mac, field, value, band)
+                    elif field == FIELD_POWER:
+                        powers[band] = value
+                    else:
+                        led = value
+
+                # All bands for the AP go out in a single radio table update
+                if powers:
+                    self.write_stats[STAT_WRITES_SENT] += 1
+                    if await self.hass.async_add_executor_job(
+                        self.api.set_radio_powers,
+                        ap["id"],
+                        mac,
+                        ap["raw_radio_table"],
+                        powers,
+                    ):
+                        self._apply_power(mac, powers)
+                    else:
+                        _LOGGER.error("Controller rejected queued power for %s", mac)
+                    for band, power in powers.items():
+                        self.journal.discard(mac, FIELD_POWER, power, band)
+
+                if led is not None:
+                    self.write_stats[STAT_WRITES_SENT] += 1
+                    if await self.hass.async_add_executor_job(
+                        self.api.set_led_override, ap["id"], mac, led
+                    ):
+                        self._apply_led(mac, led)
+                    else:
+                        _LOGGER.error("Controller rejected queued LED for %s", mac)
+                    self.journal.discard(mac, FIELD_LED, led)
 
         except UniFiAPIError as err:
-            _LOGGER.error("Failed to set LED: %s", err)
+            _LOGGER.debug("Replay for %s failed: %s", mac, err)
             return False
+
+        # Entities show the new values without waiting for the final refresh
+        self.async_update_listeners()
+
+        return True
+
+    async def async_plan_tx_power(
+        self,
+        rssi_threshold: int,
+        bands: list[str] | None = None,
+        dry_run: bool = True,
+    ) -> dict[str, Any]:
+        """Plan power levels for all APs and optionally apply them.
+
+        Only radios whose planned level differs from the current one are
+        changed, with one device update per AP.
+        """
+        try:
+            neighbors = await self.hass.async_add_executor_job(
+                self.api.get_neighbor_scan
+            )
+        except UniFiAPIError as err:
+            raise HomeAssistantError(f"Failed to fetch neighbor scan: {err}") from err
+
+        # Large sites have tens of thousands of scan entries, keep the
+        # planning pass off the event loop
+        plan, links = await self.hass.async_add_executor_job(
+            plan_tx_power, self.data, neighbors, rssi_threshold, bands
+        )
+
+        # Group the radios that actually change by AP
+        changes: dict[str, dict[str, str]] = {}
+        for (mac, band), level in plan.items():
+            if self.data[mac]["radios"][band].get("power") != level:
+                changes.setdefault(mac, {})[band] = level
+
+        result = {
+            "dry_run": dry_run,
+            "radios_planned": len(plan),
+            "overlap_links": links,
+            "changes": [
+                {
+                    "mac": mac,
+                    "name": self.data[mac]["name"],
+                    "band": band,
+                    "current": self.data[mac]["radios"][band].get("power"),
+                    "planned": level,
+                }
+                for mac, powers in changes.items()
+                for band, level in powers.items()
+            ],
+        }
+
+        if dry_run or not changes:
+            return result
+
+        # Goes through the regular write path, so each AP gets one merged
+        # update and nothing races with entity commands
+        applied = 0
+        for mac, powers in changes.items():
+            if await self._async_submit(
+                mac, {(FIELD_POWER, band): level for band, level in powers.items()}
+            ):
+                applied += 1
+
+        result["devices_updated"] = applied
+
+        return result
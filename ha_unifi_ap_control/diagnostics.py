@@ -0,0 +1,26 @@
+"""Diagnostics support for HA UniFi AP Control."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PASSWORD, CONF_USERNAME
+from .coordinator import UniFiAPCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: UniFiAPCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "access_points": len(coordinator.data),
+        "pending_writes": coordinator.journal.pending_by_device(),
+        "write_stats": dict(coordinator.write_stats),
+    }
@@ -0,0 +1,91 @@
+"""Persistent journal of writes waiting for the UniFi controller."""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, JOURNAL_SAVE_DELAY, JOURNAL_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Journal fields
+FIELD_POWER = "power"
+FIELD_LED = "led_override"
+
+
+def _journal_key(mac: str, field: str, band: str | None) -> str:
+    """Return the journal key for a device field."""
+    return f"{mac}|{field}|{band or ''}"
+
+
+class UniFiWriteJournal:
+    """Queue of desired device state, collapsed to the latest value per field."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the journal."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, JOURNAL_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.journal"
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load pending writes from disk."""
+        if (data := await self._store.async_load()) is not None:
+            self._entries = data
+
+        if self._entries:
+            _LOGGER.info("Loaded %d pending writes from journal", len(self._entries))
+
+    async def async_remove(self) -> None:
+        """Delete the journal from disk."""
+        await self._store.async_remove()
+
+    def __len__(self) -> int:
+        """Return the number of pending writes."""
+        return len(self._entries)
+
+    def get(self, mac: str, field: str, band: str | None = None) -> Any:
+        """Return the pending value for a device field, if any."""
+        entry = self._entries.get(_journal_key(mac, field, band))
+        return entry["value"] if entry else None
+
+    def queue(self, mac: str, field: str, value: Any, band: str | None = None) -> None:
+        """Record the desired value, replacing any older pending value."""
+        self._entries[_journal_key(mac, field, band)] = {
+            "mac": mac,
+            "field": field,
+            "band": band,
+            "value": value,
+            "queued_at": dt_util.utcnow().isoformat(),
+        }
+        self._async_schedule_save()
+
+    def remove(self, mac: str, field: str, band: str | None = None) -> None:
+        """Drop any pending write for a device field."""
+        if self._entries.pop(_journal_key(mac, field, band), None) is not None:
+            self._async_schedule_save()
+
+    def discard(
+        self, mac: str, field: str, value: Any, band: str | None = None
+    ) -> None:
+        """Drop a pending write, unless it was replaced by a newer value."""
+        key = _journal_key(mac, field, band)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry["value"] == value:
+            del self._entries[key]
+            self._async_schedule_save()
+
+    def pending_by_device(self) -> dict[str, list[dict[str, Any]]]:
+        """Return a snapshot of pending writes grouped by device MAC."""
+        devices: dict[str, list[dict[str, Any]]] = {}
+        for entry in self._entries.values():
+            devices.setdefault(entry["mac"], []).append(dict(entry))
+        return devices
+
+    def _async_schedule_save(self) -> None:
+        """Persist the journal, coalescing bursts of changes into one write."""
+        self._store.async_delay_save(lambda: self._entries, JOURNAL_SAVE_DELAY)
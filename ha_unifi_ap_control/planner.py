@@ -0,0 +1,171 @@
+"""Site-wide transmit power planner for UniFi APs."""
+
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Approximate attenuation of each power level relative to "high", in dB,
+# ordered from least to most reduction
+LEVEL_REDUCTION_DB = {
+    "high": 0,
+    "medium": 6,
+    "low": 12,
+}
+
+# 2.4GHz channels closer than this overlap each other
+OVERLAP_SPACING_24GHZ = 5
+
+# First channel of the bonding blocks used for wide 5GHz and 6GHz channels
+BONDING_BASE_5GHZ = 36
+BONDING_BASE_5GHZ_UPPER = 149
+BONDING_BASE_6GHZ = 1
+
+
+def _channel_number(radio: dict[str, Any]) -> int | None:
+    """Return the operating channel of a radio, if known."""
+    for key in ("current_channel", "channel"):
+        try:
+            return int(radio.get(key))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _channel_span(band: str, channel: int, width: int) -> tuple[int, int]:
+    """Return the first and last 20MHz channel covered by a wide channel."""
+    if width <= 20:
+        return channel, channel
+
+    if band == "6GHz":
+        base = BONDING_BASE_6GHZ
+    elif channel >= BONDING_BASE_5GHZ_UPPER:
+        base = BONDING_BASE_5GHZ_UPPER
+    else:
+        base = BONDING_BASE_5GHZ
+
+    # 20MHz channel numbers are 4 apart, wide channels bond aligned blocks
+    step = 4 * (width // 20)
+    start = base + (channel - base) // step * step
+    return start, start + step - 4
+
+
+def _channels_overlap(
+    band: str, first: tuple[int, int], second: tuple[int, int]
+) -> bool:
+    """Return True if two (channel, width) pairs on a band interfere."""
+    if band == "2.4GHz":
+        return abs(first[0] - second[0]) < OVERLAP_SPACING_24GHZ
+
+    first_start, first_end = _channel_span(band, *first)
+    second_start, second_end = _channel_span(band, *second)
+    return first_start <= second_end and second_start <= first_end
+
+
+def plan_tx_power(
+    aps: dict[str, dict[str, Any]],
+    neighbors: list[dict[str, Any]],
+    rssi_threshold: int,
+    bands: list[str] | None = None,
+) -> tuple[dict[tuple[str, str], str], int]:
+    """Compute a power level per AP radio that limits co-channel overlap.
+
+    Radios form the nodes of a conflict graph per band. An edge joins two
+    radios on overlapping channels that hear each other above
+    ``rssi_threshold``. 5GHz and 6GHz channels overlap when their bonded
+    blocks (from the radio's channel width) intersect. For every edge the
+    radio with the lighter load (fewer clients, then lower utilization)
+    yields, and must drop far enough to bring its strongest yielded link
+    back down to the threshold. Radios are only ever lowered: a radio that
+    yields nothing, or is already low enough, keeps its current level. The
+    whole pass is linear in the number of radios and scan entries.
+
+    Args:
+        aps: Coordinator data, keyed by AP MAC
+        neighbors: Entries from UniFiController.get_neighbor_scan
+        rssi_threshold: Signal in dBm above which two radios overlap
+        bands: Optional list of bands to plan, defaults to all
+
+    Returns:
+        The planned level per (mac, band) and the number of overlap links.
+    """
+    # Nodes: every radio with a known channel on a band being planned
+    channels: dict[tuple[str, str], tuple[int, int]] = {}
+    priority: dict[tuple[str, str], tuple] = {}
+    bssid_owner: dict[str, tuple[str, str]] = {}
+
+    for mac, ap in aps.items():
+        for band, radio in ap.get("radios", {}).items():
+            if bands and band not in bands:
+                continue
+            channel = _channel_number(radio)
+            if channel is None:
+                continue
+
+            node = (mac, band)
+            channels[node] = (channel, radio.get("channel_width") or 20)
+            priority[node] = (
+                radio.get("num_clients") or 0,
+                radio.get("channel_utilization") or 0,
+                mac,
+            )
+            for bssid in radio.get("bssids", []):
+                bssid_owner[bssid] = node
+
+    # Edges: strongest signal heard in either direction between two radios
+    links: dict[tuple[tuple[str, str], tuple[str, str]], int] = {}
+
+    for entry in neighbors:
+        heard = bssid_owner.get(entry["bssid"])
+        if heard is None or heard[0] == entry["ap_mac"]:
+            continue
+
+        observer = (entry["ap_mac"], heard[1])
+        if observer not in channels:
+            continue
+        if not _channels_overlap(heard[1], channels[observer], channels[heard]):
+            continue
+        if entry["signal"] <= rssi_threshold:
+            continue
+
+        key = (observer, heard) if observer < heard else (heard, observer)
+        links[key] = max(links.get(key, entry["signal"]), entry["signal"])
+
+    # The lighter-loaded radio on each edge yields by the excess signal,
+    # on top of whatever reduction its current level already applies
+    reduction_needed: dict[tuple[str, str], int] = {}
+
+    for (first, second), signal in links.items():
+        loser = min(first, second, key=priority.__getitem__)
+        excess = signal - rssi_threshold
+        reduction_needed[loser] = max(reduction_needed.get(loser, 0), excess)
+
+    plan: dict[tuple[str, str], str] = {}
+
+    for node in channels:
+        mac, band = node
+        current = aps[mac]["radios"][band].get("power")
+        current_reduction = LEVEL_REDUCTION_DB.get(current, 0)
+
+        # The excess was heard at the current level, so the total reduction
+        # from "high" adds to it. Auto and unknown levels count as full power
+        needed = current_reduction + reduction_needed.get(node, 0)
+
+        if needed <= current_reduction:
+            plan[node] = current
+            continue
+
+        plan[node] = next(
+            (
+                level
+                for level, reduction in LEVEL_REDUCTION_DB.items()
+                if reduction >= needed
+            ),
+            "low",
+        )
+
+    _LOGGER.debug(
+        "Planned %d radios with %d overlap links", len(plan), len(links)
+    )
+
+    return plan, len(links)
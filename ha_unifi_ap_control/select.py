@@ -85,6 +85,10 @@ class UniFiAPPowerSelect(CoordinatorEntity[UniFiAPCoordinator], SelectEntity):
         if self._mac not in self.coordinator.data:
             return None
 
+        # Show the desired level while a write is queued for the controller
+        if (pending := self.coordinator.pending_power(self._mac, self._band)) is not None:
+            return pending
+
         ap_data = self.coordinator.data[self._mac]
         radios = ap_data.get("radios", {})
 
@@ -95,11 +99,12 @@ class UniFiAPPowerSelect(CoordinatorEntity[UniFiAPCoordinator], SelectEntity):
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._mac in self.coordinator.data
-        )
+        """Return if entity is available.
+
+        Stays available while the controller is unreachable so changes can be
+        queued against the last known state.
+        """
+        return self._mac in self.coordinator.data
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -112,10 +117,12 @@ class UniFiAPPowerSelect(CoordinatorEntity[UniFiAPCoordinator], SelectEntity):
 
         if self._band in radios:
             radio = radios[self._band]
+            pending = self.coordinator.pending_power(self._mac, self._band)
             return {
                 "radio_name": radio.get("radio_name"),
                 "channel": radio.get("channel"),
                 "mac": self._mac,
+                "pending": pending is not None,
             }
 
         return {}
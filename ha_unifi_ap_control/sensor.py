@@ -0,0 +1,168 @@
+"""Sensor entities for UniFi AP radio telemetry."""
+
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import UniFiAPCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Each description key matches a field in the parsed radio data. With five
+# sensors per band per AP, only the load metrics are enabled by default
+RADIO_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="num_clients",
+        name="Clients",
+        icon="mdi:account-multiple",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="channel_utilization",
+        name="Channel Utilization",
+        icon="mdi:chart-donut",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="tx_retries",
+        entity_registry_enabled_default=False,
+        name="TX Retries",
+        icon="mdi:repeat",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="current_channel",
+        entity_registry_enabled_default=False,
+        name="Channel",
+        icon="mdi:wifi",
+    ),
+    SensorEntityDescription(
+        key="tx_power",
+        entity_registry_enabled_default=False,
+        name="TX Power",
+        icon="mdi:signal",
+        native_unit_of_measurement="dBm",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up UniFi AP radio telemetry sensors."""
+    coordinator: UniFiAPCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    entities = []
+
+    for mac, ap_data in coordinator.data.items():
+        # Create a set of telemetry sensors for each radio band on each AP
+        for band in ap_data.get("radios", {}):
+            for description in RADIO_SENSORS:
+                entities.append(
+                    UniFiAPRadioSensor(
+                        coordinator=coordinator,
+                        description=description,
+                        mac=mac,
+                        band=band,
+                        ap_name=ap_data["name"],
+                        ap_model=ap_data["model"],
+                    )
+                )
+
+    async_add_entities(entities)
+
+
+class UniFiAPRadioSensor(CoordinatorEntity[UniFiAPCoordinator], SensorEntity):
+    """Diagnostic sensor for a single radio metric."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: UniFiAPCoordinator,
+        description: SensorEntityDescription,
+        mac: str,
+        band: str,
+        ap_name: str,
+        ap_model: str,
+    ) -> None:
+        """Initialize the sensor entity."""
+        super().__init__(coordinator)
+
+        self.entity_description = description
+        self._mac = mac
+        self._band = band
+        self._ap_name = ap_name
+        self._ap_model = ap_model
+
+        # Create unique ID
+        mac_short = mac.replace(":", "")
+        band_clean = band.replace(".", "_").replace("GHz", "").strip()
+
+        self._attr_unique_id = f"{mac_short}_{band_clean}_{description.key}"
+        self._attr_name = f"{band} {description.name}"
+
+        # Device info groups all entities for this AP together
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, mac)},
+            name=ap_name,
+            manufacturer="Ubiquiti",
+            model=ap_model,
+        )
+
+        self._last_value = self._get_value()
+        self._last_available = self.available
+
+    def _get_value(self) -> Any:
+        """Return the current metric value from coordinator data."""
+        if self._mac not in self.coordinator.data:
+            return None
+
+        radio = self.coordinator.data[self._mac].get("radios", {}).get(self._band)
+        if radio is None:
+            return None
+
+        return radio.get(self.entity_description.key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when the metric or availability changed."""
+        value = self._get_value()
+        available = self.available
+
+        if value == self._last_value and available == self._last_available:
+            return
+
+        self._last_value = value
+        self._last_available = available
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the metric value."""
+        return self._last_value
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self.coordinator.last_update_success
+            and self._mac in self.coordinator.data
+        )
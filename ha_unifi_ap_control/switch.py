@@ -78,19 +78,23 @@ class UniFiAPLEDSwitch(CoordinatorEntity[UniFiAPCoordinator], SwitchEntity):
         if self._mac not in self.coordinator.data:
             return None
 
-        ap_data = self.coordinator.data[self._mac]
-        led_override = ap_data.get("led_override", "default")
+        # Show the desired mode while a write is queued for the controller
+        led_override = self.coordinator.pending_led(self._mac)
+        if led_override is None:
+            ap_data = self.coordinator.data[self._mac]
+            led_override = ap_data.get("led_override", "default")
 
         # "on" or "default" means LED is on, "off" means LED is off
         return led_override != LED_MODE_OFF
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._mac in self.coordinator.data
-        )
+        """Return if entity is available.
+
+        Stays available while the controller is unreachable so changes can be
+        queued against the last known state.
+        """
+        return self._mac in self.coordinator.data
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -102,6 +106,7 @@ class UniFiAPLEDSwitch(CoordinatorEntity[UniFiAPCoordinator], SwitchEntity):
         return {
             "led_override": ap_data.get("led_override", "default"),
             "mac": self._mac,
+            "pending": self.coordinator.pending_led(self._mac) is not None,
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
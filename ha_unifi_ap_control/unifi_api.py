@@ -18,6 +18,11 @@ class UniFiAPIError(Exception):
     pass
 
 
+class UniFiAuthError(UniFiAPIError):
+    """Exception for rejected UniFi credentials."""
+    pass
+
+
 class UniFiController:
     """Handles communication with the UniFi Controller API."""
 
@@ -52,7 +57,7 @@ class UniFiController:
 
             if result.get("meta", {}).get("rc") != "ok":
                 msg = result.get("meta", {}).get("msg", "Unknown error")
-                raise UniFiAPIError(f"Login failed: {msg}")
+                raise UniFiAuthError(f"Login failed: {msg}")
 
             self._logged_in = True
             return True
@@ -62,6 +67,9 @@ class UniFiController:
         except requests.exceptions.Timeout as err:
             raise UniFiAPIError("Connection timed out") from err
         except requests.exceptions.HTTPError as err:
+            # The controller answers bad credentials with 400 or 401
+            if err.response is not None and err.response.status_code in (400, 401):
+                raise UniFiAuthError("Invalid username or password") from err
             raise UniFiAPIError(f"HTTP error: {err}") from err
 
     def _ensure_logged_in(self) -> None:
@@ -69,6 +77,43 @@ class UniFiController:
         if not self._logged_in:
             self.login()
 
+    def get_sites(self) -> list[dict[str, Any]]:
+        """Fetch the sites this account can access, with their AP counts."""
+        self._ensure_logged_in()
+
+        try:
+            response = self.session.get(
+                f"{self.controller}/api/stat/sites",
+                timeout=10,
+            )
+            response.raise_for_status()
+            sites = response.json().get("data", [])
+
+        except requests.exceptions.RequestException as err:
+            self._logged_in = False
+            raise UniFiAPIError(f"Failed to fetch sites: {err}") from err
+
+        result = []
+        for site in sites:
+            # AP counts come from the wlan subsystem health summary
+            wlan = next(
+                (
+                    health
+                    for health in site.get("health", [])
+                    if health.get("subsystem") == "wlan"
+                ),
+                {},
+            )
+            result.append(
+                {
+                    "name": site.get("name"),
+                    "description": site.get("desc") or site.get("name"),
+                    "num_ap": wlan.get("num_ap", 0),
+                }
+            )
+
+        return result
+
     def get_access_points(self) -> list[dict[str, Any]]:
         """Fetch all access points from the controller."""
         self._ensure_logged_in()
@@ -97,14 +142,37 @@ class UniFiController:
         """Parse AP data into a cleaner format."""
         radios = {}
 
+        # Live per-radio telemetry is reported separately, keyed by radio name
+        radio_stats = {
+            stats.get("name", ""): stats
+            for stats in device.get("radio_table_stats", [])
+        }
+
+        # BSSIDs broadcast by each radio, used to match neighbor scan results
+        radio_bssids: dict[str, list[str]] = {}
+        for vap in device.get("vap_table", []):
+            if vap.get("bssid"):
+                radio_bssids.setdefault(vap.get("radio_name", ""), []).append(
+                    vap["bssid"].lower()
+                )
+
         for radio in device.get("radio_table", []):
             radio_name = radio.get("name", "")
             band = self._get_band_for_radio(radio_name)
             if band:
+                stats = radio_stats.get(radio_name, {})
                 radios[band] = {
                     "radio_name": radio_name,
                     "power": radio.get("tx_power_mode", "unknown"),
                     "channel": radio.get("channel", "auto"),
+                    "channel_width": self._parse_channel_width(radio.get("ht")),
+                    # Actual operating values from the stats table
+                    "current_channel": stats.get("channel"),
+                    "tx_power": stats.get("tx_power"),
+                    "num_clients": stats.get("num_sta"),
+                    "channel_utilization": stats.get("cu_total"),
+                    "tx_retries": stats.get("tx_retries"),
+                    "bssids": radio_bssids.get(radio_name, []),
                 }
 
         # LED state: led_override can be "default", "on", or "off"
@@ -121,6 +189,13 @@ class UniFiController:
             "led_override": led_override,
         }
 
+    @staticmethod
+    def _parse_channel_width(ht: Any) -> int | None:
+        """Return the channel width in MHz from a radio's ht setting."""
+        # Reported as "20", "40", "80" or "160", sometimes with a prefix
+        digits = "".join(char for char in str(ht or "") if char.isdigit())
+        return int(digits) if digits else None
+
     def _get_band_for_radio(self, radio_name: str) -> str | None:
         """Determine which band a radio belongs to."""
         radio_lower = radio_name.lower()
@@ -129,28 +204,97 @@ class UniFiController:
                 return band
         return None
 
+    def get_neighbor_scan(self) -> list[dict[str, Any]]:
+        """Fetch neighboring APs heard by each AP's radios.
+
+        Each entry holds the observing AP MAC, the heard BSSID, its channel
+        and the received signal in dBm.
+        """
+        self._ensure_logged_in()
+
+        try:
+            response = self.session.get(
+                f"{self.controller}/api/s/{self.site}/stat/rogueap",
+                timeout=10,
+            )
+            response.raise_for_status()
+            entries = response.json().get("data", [])
+
+        except requests.exceptions.RequestException as err:
+            self._logged_in = False
+            raise UniFiAPIError(f"Failed to fetch neighbor scan: {err}") from err
+
+        neighbors = []
+        for entry in entries:
+            signal = entry.get("signal")
+            if signal is None and entry.get("rssi") is not None:
+                # rssi is reported relative to a -95 dBm noise floor
+                signal = entry["rssi"] - 95
+            if signal is None or not entry.get("ap_mac") or not entry.get("bssid"):
+                continue
+
+            neighbors.append(
+                {
+                    "ap_mac": entry["ap_mac"].lower(),
+                    "bssid": entry["bssid"].lower(),
+                    "channel": entry.get("channel"),
+                    "signal": signal,
+                }
+            )
+
+        return neighbors
+
+    def _raise_if_unavailable(self, response: requests.Response) -> None:
+        """Raise if a response means the controller is temporarily unavailable.
+
+        UniFi OS consoles answer 502/503 while the Network application
+        restarts, so a 5xx is treated like a connection error rather than a
+        rejected change. The session is kept: the controller did not reject
+        it, and logging in again from every writer only adds load while the
+        controller is struggling.
+        """
+        if response.status_code >= 500:
+            raise UniFiAPIError(
+                f"Controller unavailable: HTTP {response.status_code}"
+            )
+
     def set_radio_power(
         self, device_id: str, mac: str, radio_table: list, band: str, power: str
     ) -> bool:
         """Set the power level for a specific radio band."""
+        return self.set_radio_powers(device_id, mac, radio_table, {band: power})
+
+    def set_radio_powers(
+        self, device_id: str, mac: str, radio_table: list, powers: dict[str, str]
+    ) -> bool:
+        """Set the power level for several radio bands in a single update.
+
+        Args:
+            device_id: The UniFi device ID
+            mac: The device MAC address (for logging)
+            radio_table: The device's current radio table
+            powers: Mapping of band name to power level
+        """
         self._ensure_logged_in()
 
-        # Find and update the correct radio in the table
+        # Find and update the correct radios in the table
         updated_table = []
-        changed = False
+        changed_bands = set()
 
         for radio in radio_table:
             radio_copy = radio.copy()
-            radio_name = radio_copy.get("name", "")
+            band = self._get_band_for_radio(radio_copy.get("name", ""))
 
-            if self._get_band_for_radio(radio_name) == band:
-                radio_copy["tx_power_mode"] = power
-                changed = True
+            if band in powers:
+                radio_copy["tx_power_mode"] = powers[band]
+                changed_bands.add(band)
 
             updated_table.append(radio_copy)
 
-        if not changed:
+        for band in powers.keys() - changed_bands:
             _LOGGER.warning("No radio found for band %s on device %s", band, mac)
+
+        if not changed_bands:
             return False
 
         try:
@@ -161,9 +305,11 @@ class UniFiController:
             )
 
             if response.status_code == 200:
-                _LOGGER.info("Set %s power to %s on %s", band, power, mac)
+                for band in sorted(changed_bands):
+                    _LOGGER.info("Set %s power to %s on %s", band, powers[band], mac)
                 return True
             else:
+                self._raise_if_unavailable(response)
                 _LOGGER.error(
                     "Failed to set power: HTTP %s - %s",
                     response.status_code,
@@ -196,6 +342,7 @@ class UniFiController:
                 _LOGGER.info("Set LED to %s on %s", mode, mac)
                 return True
             else:
+                self._raise_if_unavailable(response)
                 _LOGGER.error(
                     "Failed to set LED: HTTP %s - %s",
                     response.status_code,
@@ -206,12 +353,3 @@ class UniFiController:
         except requests.exceptions.RequestException as err:
             self._logged_in = False
             raise UniFiAPIError(f"Failed to update LED: {err}") from err
-
-    def test_connection(self) -> bool:
-        """Test the connection to the controller."""
-        try:
-            self.login()
-            self.get_access_points()
-            return True
-        except UniFiAPIError:
-            return False
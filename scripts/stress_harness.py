@@ -0,0 +1,399 @@
+"""Stress harness for burst entity commands against a fake UniFi controller.
+
+Starts a local HTTP server that mimics the controller endpoints used by the
+integration, then fires a burst of LED and power commands through the real
+entities and coordinator, the same way an automation targeting every AP
+would. Reports controller writes, refreshes, completion time, event loop and
+executor delays, and whether the controller ended up in the requested state.
+
+Requires Home Assistant to be installed. Run from the repository root:
+
+    python scripts/stress_harness.py --aps 300 --latency 0.05 --failure-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from ha_unifi_ap_control.const import LED_MODE_OFF  # noqa: E402
+from ha_unifi_ap_control.coordinator import UniFiAPCoordinator  # noqa: E402
+from ha_unifi_ap_control.journal import UniFiWriteJournal  # noqa: E402
+from ha_unifi_ap_control.select import UniFiAPPowerSelect  # noqa: E402
+from ha_unifi_ap_control.switch import UniFiAPLEDSwitch  # noqa: E402
+from ha_unifi_ap_control.unifi_api import UniFiController  # noqa: E402
+
+SITE = "default"
+
+# Radio layout of every fake AP: radio name, radio type, channel
+FAKE_RADIOS = [
+    ("wifi0", "ng", 6),
+    ("wifi1", "na", 36),
+]
+
+
+class FakeController:
+    """In-memory UniFi controller state with request counters."""
+
+    def __init__(
+        self, num_aps: int, latency: float, failure_rate: float, drop_rate: float
+    ) -> None:
+        """Create the fake devices."""
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.lock = threading.Lock()
+        self.counters = {
+            "logins": 0,
+            "device_fetches": 0,
+            "puts": 0,
+            "puts_failed": 0,
+            "puts_dropped": 0,
+        }
+        self.devices: dict[str, dict[str, Any]] = {}
+
+        for index in range(num_aps):
+            device_id = f"dev{index:05d}"
+            mac = ":".join(
+                f"{byte:02x}" for byte in (2, 0, 0, *index.to_bytes(3, "big"))
+            )
+            self.devices[device_id] = {
+                "_id": device_id,
+                "mac": mac,
+                "name": f"AP {index}",
+                "model": "U6-Pro",
+                "led_override": "default",
+                "radio_table": [
+                    {
+                        "name": name,
+                        "radio": radio,
+                        "channel": channel,
+                        "tx_power_mode": "high",
+                    }
+                    for name, radio, channel in FAKE_RADIOS
+                ],
+                "radio_table_stats": [
+                    {
+                        "name": name,
+                        "channel": channel,
+                        "tx_power": 20,
+                        "num_sta": index % 17,
+                        "cu_total": index % 60,
+                        "tx_retries": 0,
+                    }
+                    for name, _, channel in FAKE_RADIOS
+                ],
+            }
+
+    def count(self, counter: str) -> None:
+        """Increment a request counter."""
+        with self.lock:
+            self.counters[counter] += 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Return a copy of the request counters."""
+        with self.lock:
+            return dict(self.counters)
+
+
+def _make_handler(controller: FakeController) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler bound to a fake controller."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve the subset of the controller API the integration uses."""
+
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Silence per-request logging."""
+
+        def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self) -> dict[str, Any]:
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_POST(self) -> None:
+            time.sleep(controller.latency)
+            self._read_json()
+            if self.path == "/api/login":
+                controller.count("logins")
+                self._send_json(200, {"meta": {"rc": "ok"}, "data": []})
+            else:
+                self._send_json(404, {"meta": {"rc": "error"}})
+
+        def do_GET(self) -> None:
+            time.sleep(controller.latency)
+            if self.path == f"/api/s/{SITE}/stat/device":
+                controller.count("device_fetches")
+                with controller.lock:
+                    data = json.loads(json.dumps(list(controller.devices.values())))
+                self._send_json(200, {"meta": {"rc": "ok"}, "data": data})
+            else:
+                self._send_json(404, {"meta": {"rc": "error"}})
+
+        def do_PUT(self) -> None:
+            time.sleep(controller.latency)
+            payload = self._read_json()
+            controller.count("puts")
+
+            roll = random.random()
+            if roll < controller.drop_rate:
+                # Close without answering, the client sees a connection error
+                controller.count("puts_dropped")
+                self.close_connection = True
+                return
+            if roll < controller.drop_rate + controller.failure_rate:
+                controller.count("puts_failed")
+                self._send_json(500, {"meta": {"rc": "error", "msg": "injected"}})
+                return
+
+            device_id = self.path.rsplit("/", 1)[-1]
+            with controller.lock:
+                device = controller.devices.get(device_id)
+                if device is not None:
+                    device.update(payload)
+
+            if device is None:
+                self._send_json(404, {"meta": {"rc": "error"}})
+            else:
+                self._send_json(200, {"meta": {"rc": "ok"}, "data": []})
+
+    return Handler
+
+
+async def _async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a minimal Home Assistant instance for the coordinator."""
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Older releases set the config dir after construction
+        hass = HomeAssistant()  # type: ignore[call-arg]
+        hass.config.config_dir = config_dir
+
+    try:
+        from homeassistant.helpers import frame
+
+        frame.async_setup(hass)
+    except (ImportError, AttributeError):
+        pass
+
+    return hass
+
+
+async def _async_monitor_loop(
+    interval: float, lags: list[float], stop: asyncio.Event
+) -> None:
+    """Record how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def _async_monitor_executor(
+    hass: HomeAssistant, interval: float, delays: list[float], stop: asyncio.Event
+) -> None:
+    """Record how long a trivial job waits for a free executor thread."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await hass.async_add_executor_job(time.monotonic)
+        delays.append(loop.time() - start)
+        await asyncio.sleep(interval)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return a percentile of a list of values."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100)[int(percent) - 1]
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run one burst and return the report."""
+    random.seed(args.seed)
+    controller = FakeController(
+        args.aps, args.latency, args.failure_rate, args.drop_rate
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(controller))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_create_hass(config_dir)
+
+        api = UniFiController(
+            controller_url=f"http://127.0.0.1:{server.server_address[1]}",
+            username="harness",
+            password="harness",
+            site=SITE,
+        )
+        journal = UniFiWriteJournal(hass, "stress_harness")
+        coordinator = UniFiAPCoordinator(hass, api, journal)
+        await coordinator.async_refresh()
+
+        switches = []
+        selects = []
+        for mac, ap in coordinator.data.items():
+            switch = UniFiAPLEDSwitch(coordinator, mac, ap["name"], ap["model"])
+            switch.hass = hass
+            switches.append(switch)
+            for band in ap["radios"]:
+                select = UniFiAPPowerSelect(
+                    coordinator, mac, band, ap["name"], ap["model"]
+                )
+                select.hass = hass
+                selects.append(select)
+
+        before = controller.snapshot()
+        stop = asyncio.Event()
+        loop_lags: list[float] = []
+        executor_delays: list[float] = []
+        monitors = [
+            asyncio.create_task(_async_monitor_loop(0.01, loop_lags, stop)),
+            asyncio.create_task(
+                _async_monitor_executor(hass, 0.05, executor_delays, stop)
+            ),
+        ]
+
+        # Fire every command at once, like a time-triggered automation
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            await asyncio.gather(
+                *(switch.async_turn_off() for switch in switches),
+                *(select.async_select_option(args.power) for select in selects),
+            )
+        commands_done = time.perf_counter() - start
+
+        # Let debounced refreshes and any journal replay finish
+        await asyncio.sleep(args.settle)
+        await hass.async_block_till_done()
+        settled = time.perf_counter() - start
+        pending_after_settle = len(journal)
+
+        # Writes queued by injected failures are replayed on the next good
+        # poll, so stand in for the scan interval until the journal drains
+        polls = 0
+        while len(journal) and polls < args.drain_polls:
+            polls += 1
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+        drained = time.perf_counter() - start
+
+        stop.set()
+        await asyncio.gather(*monitors)
+        after = controller.snapshot()
+
+        # Compare the controller's final state with what was requested
+        wrong_led = 0
+        wrong_power = 0
+        with controller.lock:
+            for device in controller.devices.values():
+                if device["led_override"] != LED_MODE_OFF:
+                    wrong_led += 1
+                wrong_power += sum(
+                    radio["tx_power_mode"] != args.power
+                    for radio in device["radio_table"]
+                )
+
+        report = {
+            "aps": args.aps,
+            "commands": args.repeat * (len(switches) + len(selects)),
+            "puts": after["puts"] - before["puts"],
+            "puts_failed": after["puts_failed"] - before["puts_failed"],
+            "puts_dropped": after["puts_dropped"] - before["puts_dropped"],
+            "refreshes": after["device_fetches"] - before["device_fetches"],
+            "logins": after["logins"] - before["logins"],
+            "write_stats": dict(coordinator.write_stats),
+            "pending_after_settle": pending_after_settle,
+            "drain_polls": polls,
+            "pending_writes": len(journal),
+            "commands_done_s": round(commands_done, 3),
+            "settled_s": round(settled, 3),
+            "drained_s": round(drained, 3),
+            "loop_lag_max_ms": round(max(loop_lags, default=0) * 1000, 1),
+            "loop_lag_p95_ms": round(_percentile(loop_lags, 95) * 1000, 1),
+            "executor_wait_max_ms": round(max(executor_delays, default=0) * 1000, 1),
+            "executor_wait_p95_ms": round(_percentile(executor_delays, 95) * 1000, 1),
+            "wrong_led": wrong_led,
+            "wrong_power": wrong_power,
+        }
+
+        coordinator.async_cancel_replay()
+        coordinator.async_cancel_writers()
+        await hass.async_stop(force=True)
+
+    server.shutdown()
+    return report
+
+
+def main() -> None:
+    """Parse arguments, run the burst and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--aps", type=int, default=300, help="number of fake APs")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds added to each request"
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="fraction of PUTs answered with HTTP 500",
+    )
+    parser.add_argument(
+        "--drop-rate",
+        type=float,
+        default=0.0,
+        help="fraction of PUTs closed without a response",
+    )
+    parser.add_argument(
+        "--power", default="low", help="power level every radio is set to"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="times the same burst is fired"
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=12.0,
+        help="seconds to wait for debounced refreshes after the burst",
+    )
+    parser.add_argument(
+        "--drain-polls",
+        type=int,
+        default=20,
+        help="extra polls allowed to replay writes queued by failures",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--verbose", action="store_true", help="show debug logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    report = asyncio.run(async_run(args))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()